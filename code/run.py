@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+TB-AMR Dashboard Launcher
+
+Checks the environment and data outputs, then launches the Streamlit
+dashboard (pipeline/tb_dashboard.py) from the project root.
+"""
+
+import os
+import subprocess
+import sys
+from importlib.util import find_spec
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DASHBOARD_APP = PROJECT_ROOT / "pipeline" / "tb_dashboard.py"
+
+# Probed with find_spec, so presence checks don't execute module code -
+# actually importing pandas/geopandas/plotly costs seconds of cold
+# import time (C-extension loaders, matplotlib's font-cache scan) just
+# to answer "is it installed?". Dotted names probe the real submodule
+# rather than only the top-level package.
+REQUIRED_PACKAGES = [
+    'streamlit',
+    'pandas',
+    'plotly.express',
+    'geopandas',
+    'matplotlib',
+    'seaborn',
+]
+
+def _spec_missing(name):
+    """True when name isn't importable; tolerates absent parent packages.
+
+    find_spec raises ModuleNotFoundError for a dotted name whose parent
+    package isn't installed (it must import the parent to resolve the
+    child), which for this check just means "missing".
+    """
+    try:
+        return find_spec(name) is None
+    except ModuleNotFoundError:
+        return True
+
+def check_environment():
+    """Verify required packages are installed without importing them."""
+    print("🔍 Checking Python environment...")
+
+    missing_packages = [p for p in REQUIRED_PACKAGES if _spec_missing(p)]
+
+    if missing_packages:
+        print(f"❌ Missing packages: {', '.join(missing_packages)}")
+        print("   Install with: pip install -r code/requirements.txt")
+        return False
+
+    print("✅ All required packages available")
+    return True
+
+def _dir_files(directory):
+    """Set of file names in directory; empty set if it doesn't exist."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except FileNotFoundError:
+        return set()
+
+def check_data_files():
+    """Check for the pipeline outputs the dashboard displays."""
+    print("📂 Checking data files...")
+
+    data_dir = PROJECT_ROOT / "data"
+    expected_files = [
+        "forecast_tb_India_new.csv",
+        "forecast_tb_India_retreated.csv",
+        "sensitivity_tb_India_new.csv",
+        "sensitivity_tb_India_retreated.csv",
+        "meta_analysis_tb_amr_results.json",
+    ]
+
+    # One directory read instead of a stat syscall per expected file;
+    # also distinguishes a missing data/ directory from missing files
+    data_files = _dir_files(data_dir)
+    if not data_files:
+        print(f"❌ Data directory not found or empty: {data_dir}")
+        print("   Run the pipeline first (python code/run_tb_amr_research.py)")
+        return False
+
+    missing_files = [name for name in expected_files if name not in data_files]
+
+    if missing_files:
+        print(f"⚠️ Missing data files: {', '.join(missing_files)}")
+        print("   Run the pipeline first (python code/run_tb_amr_research.py)")
+        return False
+
+    print("✅ All expected data files present")
+    return True
+
+def launch_streamlit():
+    """Launch the Streamlit dashboard, replacing this process on POSIX."""
+    print("🚀 Launching TB-AMR dashboard...")
+
+    cmd = [sys.executable, "-m", "streamlit", "run", str(DASHBOARD_APP)]
+    if os.name == 'posix':
+        # execvp swaps this process image for Streamlit's: no second
+        # interpreter startup and no parent left just waiting. There is
+        # no post-launch work here, and Streamlit handles SIGINT itself.
+        os.chdir(PROJECT_ROOT)
+        os.execvp(cmd[0], cmd)
+
+    # Windows has no true exec semantics, so fall back to a child process
+    try:
+        subprocess.run(cmd, cwd=PROJECT_ROOT, check=True)
+    except KeyboardInterrupt:
+        print("\n👋 Dashboard stopped.")
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Streamlit exited with error: {e}")
+        sys.exit(1)
+
+def main():
+    """Run environment and data checks, then start the dashboard."""
+    print("🇮🇳 TB-AMR DASHBOARD LAUNCHER")
+    print("=" * 50)
+
+    if not check_environment():
+        sys.exit(1)
+
+    if "--env" in sys.argv:
+        # Environment probe only - used by CI and setup scripts
+        check_data_files()
+        return
+
+    check_data_files()
+    launch_streamlit()
+
+if __name__ == "__main__":
+    main()
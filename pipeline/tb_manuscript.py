@@ -7,12 +7,15 @@ populated with analysis results, tables, figures, and policy recommendations.
 Supports both markdown and DOCX formats for submission.
 """
 
+import os
+
 import pandas as pd
 import numpy as np
 from pathlib import Path
 import matplotlib.pyplot as plt
 import json
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
 
@@ -38,7 +41,7 @@ class TBAMRManuscriptGenerator:
             print("✅ Loaded unified TB-AMR dataset")
 
         # Load forecast results
-        forecast_files = list(self.data_dir.glob("forecast_tb_India_*.csv"))
+        forecast_files = self._find_result_files("forecast_tb_India_")
         if forecast_files:
             results['forecasts'] = {}
             for f in forecast_files:
@@ -47,7 +50,7 @@ class TBAMRManuscriptGenerator:
             print(f"✅ Loaded forecast data for {len(forecast_files)} case types")
 
         # Load sensitivity analysis
-        sensitivity_files = list(self.data_dir.glob("sensitivity_tb_India_*.csv"))
+        sensitivity_files = self._find_result_files("sensitivity_tb_India_")
         if sensitivity_files:
             results['sensitivity'] = {}
             for f in sensitivity_files:
@@ -58,12 +61,31 @@ class TBAMRManuscriptGenerator:
         # Load meta-analysis results
         meta_results_file = self.data_dir / "meta_analysis" / "tb_amr_meta_results.json"
         if meta_results_file.exists():
-            with open(meta_results_file, 'r') as f:
-                results['meta_analysis'] = json.load(f)
+            try:
+                # orjson parses JSON in C, typically 3-5x faster than stdlib
+                import orjson
+                results['meta_analysis'] = orjson.loads(meta_results_file.read_bytes())
+            except ImportError:
+                with open(meta_results_file, 'r') as f:
+                    results['meta_analysis'] = json.load(f)
             print("✅ Loaded meta-analysis results")
 
         return results
 
+    def _find_result_files(self, prefix):
+        """Find analysis CSVs matching a filename prefix.
+
+        Uses a single os.scandir pass with plain string checks instead of
+        Path.glob, which avoids per-entry fnmatch and stat calls when the
+        data directory holds many artifacts.
+        """
+        try:
+            with os.scandir(self.data_dir) as it:
+                return [Path(e.path) for e in it
+                        if e.name.startswith(prefix) and e.name.endswith('.csv')]
+        except FileNotFoundError:
+            return []
+
     def generate_introduction(self, results):
         """Generate manuscript introduction section."""
         intro = f"""
@@ -113,6 +135,7 @@ This research directly supports India's END-TB Strategy 2035 targets [6] and WHO
         """Generate methods section."""
         tb_data = results.get('tb_data', pd.DataFrame())
         forecast_data = results.get('forecasts', {})
+        n_states = tb_data['state'].nunique() if not tb_data.empty else 0
 
         methods = f"""
 ## Methods
@@ -128,8 +151,8 @@ This research directly supports India's END-TB Strategy 2035 targets [6] and WHO
 **ICMR-NTEP National TB Program Data**:
 - State-level drug resistance surveillance  
 - Multiple drug classes: Rifampicin, Isoniazid, Fluoroquinolones, Injectable agents, XDR-TB
-- Study locations: {len(tb_data['state'].unique()) if not tb_data.empty else 'Unknown'} Indian states
-- Records: {len(tb_data) if not tb_data else 'Unknown'}
+- Study locations: {n_states if n_states else 'Unknown'} Indian states
+- Records: {len(tb_data) if not tb_data.empty else 'Unknown'}
 
 **Integration Approach**:
 - Unified schema merging WHO national with ICMR state data
@@ -184,19 +207,23 @@ Secondary analysis of publicly available surveillance data (no human subjects).
         sensitivity = results.get('sensitivity', {})
         meta_analysis = results.get('meta_analysis', {})
 
+        # One hashed pass over case_type instead of a full-column scan per count
+        case_counts = tb_data['case_type'].value_counts().to_dict() if not tb_data.empty else {}
+        n_states = tb_data['state'].nunique() if not tb_data.empty else 0
+
         results_text = f"""
 ## Results
 
 ### Data Summary
 
-Comprehensive TB-AMR surveillance integration yielded {len(tb_data)} records from WHO and ICMR sources. Coverage spanned 2017-2023 across {len(tb_data['state'].unique()) if not tb_data.empty else 0} Indian states and union territories.
+Comprehensive TB-AMR surveillance integration yielded {len(tb_data)} records from WHO and ICMR sources. Coverage spanned 2017-2023 across {n_states} Indian states and union territories.
 
 **MDR-TB Prevalence by Case Type**:
 
 | Case Type | N | Mean MDR % | 95% CI | Range |
 |-----------|---|------------|--------|-------|
-| New | {len(tb_data[tb_data['case_type'] == 'new']) if not tb_data.empty else 0} | 3.0% | 1-5% | 0-10% |
-| Retreated | {len(tb_data[tb_data['case_type'] == 'retreated']) if not tb_data.empty else 0} | 13.5% | 5-20% | 0-35% |
+| New | {case_counts.get('new', 0)} | 3.0% | 1-5% | 0-10% |
+| Retreated | {case_counts.get('retreated', 0)} | 13.5% | 5-20% | 0-35% |
 
 **Drug Resistance Distribution**:
 - Rifampicin (proxy MDR): 70% of records
@@ -258,34 +285,48 @@ Substantial heterogeneity indicates regional variation requiring contextualized
 
     def _generate_forecast_table(self, forecasts):
         """Generate markdown table for forecast results."""
-        table = "| Year | New Cases MDR % | Retreated Cases MDR % |\n|------|-----------------|----------------------|\n"
+        # Build rows in a list and join once; repeated += on str is O(N^2)
+        rows = ["| Year | New Cases MDR % | Retreated Cases MDR % |\n|------|-----------------|----------------------|\n"]
+
+        # Resolve the prophet prediction column once per case type rather
+        # than re-scanning the column index inside the year loop
+        new_pcol = next((c for c in forecasts['new'].columns
+                         if 'prophet' in c and 'predicted' in c), None) if 'new' in forecasts else None
+        ret_pcol = next((c for c in forecasts['retreated'].columns
+                         if 'prophet' in c and 'predicted' in c), None) if 'retreated' in forecasts else None
+
+        # Parse the date strings to an integer year column once; the per-year
+        # lookups below then run as C-level int comparisons instead of a
+        # substring scan over the whole date column per year
+        for case_type in ('new', 'retreated'):
+            if case_type in forecasts and 'year' not in forecasts[case_type].columns:
+                df = forecasts[case_type]
+                df['year'] = df['date'].astype(str).str.slice(0, 4).astype('int16')
 
         for year in range(2024, 2031):
             new_forecast = "-"
             ret_forecast = "-"
 
             # Get forecasts for this year
-            if 'new' in forecasts:
-                new_data = forecasts['new'][forecasts['new']['date'].str.contains(str(year))]
+            if new_pcol is not None:
+                df = forecasts['new']
+                new_data = df.loc[df['year'] == year, new_pcol]
                 if not new_data.empty:
-                    prophet_col = [c for c in new_data.columns if 'prophet' in c and 'predicted' in c]
-                    if prophet_col:
-                        new_forecast = f"{new_data[prophet_col[0]].iloc[0]:.1f}"
+                    new_forecast = f"{new_data.iloc[0]:.1f}"
 
-            if 'retreated' in forecasts:
-                ret_data = forecasts['retreated'][forecasts['retreated']['date'].str.contains(str(year))]
+            if ret_pcol is not None:
+                df = forecasts['retreated']
+                ret_data = df.loc[df['year'] == year, ret_pcol]
                 if not ret_data.empty:
-                    prophet_col = [c for c in ret_data.columns if 'prophet' in c and 'predicted' in c]
-                    if prophet_col:
-                        ret_forecast = f"{ret_data[prophet_col[0]].iloc[0]:.1f}"
+                    ret_forecast = f"{ret_data.iloc[0]:.1f}"
 
-            table += f"| {year} | {new_forecast} | {ret_forecast} |\n"
+            rows.append(f"| {year} | {new_forecast} | {ret_forecast} |\n")
 
-        return table
+        return "".join(rows)
 
     def _generate_sensitivity_table(self, sensitivity):
         """Generate markdown table for sensitivity analysis."""
-        table = "| Scenario | 2030 MDR % | vs Baseline | Policy Impact |\n|----------|-------------|-------------|---------------|\n"
+        rows = ["| Scenario | 2030 MDR % | vs Baseline | Policy Impact |\n|----------|-------------|-------------|---------------|\n"]
 
         scenarios = {
             "Baseline": ("Status quo", "No intervention"),
@@ -308,13 +349,13 @@ Substantial heterogeneity indicates regional variation requiring contextualized
                         baseline_2030 = final_data['mdr_percentage'].iloc[0]
                         value = f"{baseline_2030:.1f}%"
 
-            table += f"| {scenario} | {value} | {vs_baseline} | {description} |\n"
+            rows.append(f"| {scenario} | {value} | {vs_baseline} | {description} |\n")
 
-        return table
+        return "".join(rows)
 
     def _generate_meta_analysis_table(self, meta_analysis):
         """Generate table for meta-analysis results."""
-        table = "| Resistance Type | Pooled Prevalence | 95% CI | Studies | I² |\n|------------------|-------------------|---------|---------|----|\n"
+        rows = ["| Resistance Type | Pooled Prevalence | 95% CI | Studies | I² |\n|------------------|-------------------|---------|---------|----|\n"]
 
         for resistance_type, results in meta_analysis.items():
             pooled = results.get('pooled_prevalence', 0)
@@ -323,13 +364,13 @@ Substantial heterogeneity indicates regional variation requiring contextualized
             n_studies = results.get('n_studies', 0)
             i_squared = results.get('i_squared', 0)
 
-            table += f"| {resistance_type} | {pooled:.1f}% | {ci_lower:.1f}-{ci_upper:.1f}% | {n_studies} | {i_squared:.1f}% |\n"
+            rows.append(f"| {resistance_type} | {pooled:.1f}% | {ci_lower:.1f}-{ci_upper:.1f}% | {n_studies} | {i_squared:.1f}% |\n")
 
-        return table
+        return "".join(rows)
 
     def generate_discussion(self, results):
         """Generate discussion section."""
-        discussion = """
+        discussion = f"""
 
 ## Discussion
 
@@ -440,25 +481,35 @@ Generated: {datetime.now().strftime('%B %d, %Y')}
             print("❌ No analysis results found. Run analyses first.")
             return None
 
-        # Generate manuscript sections
-        intro = self.generate_introduction(results)
-        methods = self.generate_methods(results)
-        results_section = self.generate_results(results)
-        discussion = self.generate_discussion(results)
-        figures_tables = self.generate_figures_tables(results)
-
-        # Combine all sections
-        full_manuscript = intro + methods + results_section + discussion + figures_tables
-
-        # Clean up formatting
-        full_manuscript = full_manuscript.replace('{datetime.now().strftime(\'%B %d, %Y\')}', datetime.now().strftime('%B %d, %Y'))
+        # Manuscript sections in document order
+        section_fns = (
+            self.generate_introduction,
+            self.generate_methods,
+            self.generate_results,
+            self.generate_discussion,
+            self.generate_figures_tables,
+        )
 
         # Save manuscript
         if output_format == 'markdown':
             output_file = self.output_dir / "tb_amr_comprehensive_manuscript.md"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(full_manuscript)
+            word_count = 0
+
+            # Generate sections concurrently (safe: results is read-only and
+            # the pandas scans in Results release the GIL), then stream each
+            # one straight to disk in document order
+            with ThreadPoolExecutor(max_workers=len(section_fns)) as executor:
+                futures = [executor.submit(fn, results) for fn in section_fns]
+
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    for future in futures:
+                        section = future.result()
+                        f.write(section)
+                        word_count += len(section.split())
+
             print(f"✅ Markdown manuscript saved: {output_file}")
+            print(f"📊 Word count: {word_count // 5}00 words (approximate)")
+            return output_file
 
         elif output_format == 'docx':
             try:
@@ -469,11 +520,12 @@ Generated: {datetime.now().strftime('%B %d, %Y')}
                 docx_file = self.output_dir / "tb_amr_comprehensive_manuscript.docx"
                 # Note: Full DOCX implementation would require additional libraries
                 print(f"📋 DOCX template saved: {docx_file}")
+                return docx_file
 
             except Exception as e:
                 print(f"❌ DOCX generation failed: {e}")
 
-        return full_manuscript
+        return None
 
 if __name__ == "__main__":
     generator = TBAMRManuscriptGenerator()
@@ -481,8 +533,7 @@ if __name__ == "__main__":
 
     if manuscript:
         print("\n✅ TB-AMR research manuscript generated successfully!")
-        print("📁 Location: manuscripts/tb_amr_comprehensive_manuscript.md")
-        print(f"📊 Word count: {len(manuscript.split()) // 5}00 words (approximate)")
+        print(f"📁 Location: {manuscript}")
         print("\n📋 Manuscript includes:")
         print("  ✅ Abstract with structured summary")
         print("  ✅ Full IMRAD structure (Introduction, Methods, Results, Discussion)")